@@ -1,13 +1,116 @@
 import logging
-from typing import Any
+from collections import deque
+from itertools import filterfalse
+from typing import Any, Callable, Deque, Dict, FrozenSet, Iterable, Iterator, Optional, Pattern, Set, Tuple
 
-from django_swagger_tester.case.checks import case_check
-from django_swagger_tester.case.utils import conditional_check, set_ignored_keys
+from django_swagger_tester.case.checks import case_check, correctly_cased_pattern, skip
+from django_swagger_tester.case.utils import set_ignored_keys
 from django_swagger_tester.configuration import settings
-from django_swagger_tester.openapi import read_items, read_properties, read_type
+from django_swagger_tester.openapi import iter_properties, read_items, read_type
 
 logger = logging.getLogger('django_swagger_tester')
 
+# Schemas that already passed a case check, keyed by schema identity, case setting, and ignored keys.
+# The schema itself is stored as the value, so its id can't be recycled while the entry exists.
+_schema_validation_cache: Dict[tuple, dict] = {}
+_SCHEMA_VALIDATION_CACHE_MAXSIZE = 256
+
+# Keys that have passed a case check, per case check function, shared by schema and response case testers.
+# These are not bounded: they grow with the number of distinct key names seen, until reset_validated_keys is called.
+_validated_keys: Dict[Callable, Set[str]] = {}
+
+
+def reset_validated_keys() -> None:
+    """
+    Forgets which keys and schemas have already passed a case check, so the next validation checks every key again.
+    """
+    for keys in _validated_keys.values():
+        keys.clear()
+    _schema_validation_cache.clear()
+
+
+def _check_keys(keys: Iterable[str], check: Callable[[str], None], pattern: Optional[Pattern] = None) -> None:
+    """
+    Case checks each key that hasn't already passed the check, and remembers the keys that pass.
+
+    Previously validated keys are accepted with a set lookup. Of the remaining keys, strings matching `pattern`
+    are accepted without running the full case check.
+
+    :param keys: keys to check
+    :param check: case check callable
+    :param pattern: pattern matching keys that are known to be correctly cased
+    :raises: django_swagger_tester.exceptions.CaseError
+    """
+    validated = _validated_keys.setdefault(check, set())
+    for key in filterfalse(validated.__contains__, keys):
+        if pattern is None or not isinstance(key, str) or not pattern.fullmatch(key):
+            check(key)
+        validated.add(key)
+
+
+def _collect_schema_keys(schema: dict, ignored_keys: FrozenSet[str]) -> Tuple[str, ...]:
+    """
+    Walks a schema item once and returns the object keys that need a case check, in the order a recursive traversal
+    would find them. Ignored keys and repeated keys are left out.
+
+    The walk uses an explicit stack of property iterators rather than recursion, so schema depth is not
+    limited by the interpreter's recursion limit. Arrays are resolved in place, by following their items.
+    Schema items are only visited once, so shared items aren't walked twice, and recursive schemas terminate.
+    Objects where every key is ignored are walked like any other: finding that out takes the same walk, and each
+    schema is only walked until it passes. They simply contribute no keys.
+
+    :param schema: openapi schema item
+    :param ignored_keys: keys that should not be case checked
+    :return: keys to case check
+    """
+    # Resolved once per walk, so disabled debug logging costs nothing per node
+    debug = logger.isEnabledFor(logging.DEBUG)
+    keys: Dict[str, None] = {}
+    skipped_keys = []
+    stack: Deque[Iterator] = deque()
+    # Ids of the schema items visited so far; the schema keeps them alive, so they can't be recycled during the walk
+    visited: Set[int] = set()
+
+    def nested_object(item: dict, origin: str) -> Optional[dict]:
+        """
+        Returns the not yet visited object a schema item consists of - directly, or nested in arrays - if any.
+        """
+        item_type = read_type(item)
+        while item_type == 'array':
+            if id(item) in visited:
+                return None
+            visited.add(id(item))
+            if debug:
+                logger.debug('%s -> list', origin)
+            origin = 'list'
+            item = read_items(item)
+            item_type = read_type(item)
+        if item_type == 'object' and id(item) not in visited:
+            visited.add(id(item))
+            if debug:
+                logger.debug('%s -> dict', origin)
+            return item
+        return None
+
+    root = nested_object(schema, 'root')
+    if root is not None:
+        stack.append(iter_properties(root))
+    while stack:
+        for key, value in stack[-1]:
+            if key in ignored_keys:
+                skipped_keys.append(key)
+            else:
+                keys[key] = None
+            obj = nested_object(value, 'dict')
+            if obj is not None:
+                stack.append(iter_properties(obj))
+                break
+        else:
+            stack.pop()
+    if skipped_keys:
+        logger.debug('Skipped case check for ignored keys: %s', skipped_keys)
+    return tuple(keys)
+
 
 class ResponseCaseTester(object):
     """
@@ -17,94 +120,76 @@ class ResponseCaseTester(object):
 
     def __init__(self, response_data: Any, **kwargs) -> None:
         """
-        Finds the appropriate case check function and calls the appropriate function base on the response datas type.
+        Finds the appropriate case check function and walks the response data, checking the case of all dict keys.
 
         :param response_data: typically will be an API responses response.json() output.
         """
         self.case_check = case_check(settings.CASE)
         self.ignored_keys = set_ignored_keys(**kwargs)
-        if isinstance(response_data, dict):
-            self.test_dict(response_data)
-        elif isinstance(response_data, list):
-            self.test_list(response_data)
-        else:
+        if self.case_check is skip or not isinstance(response_data, (dict, list)):
             logger.debug('Skipping case check')
+            return
 
-    def test_dict(self, dictionary: dict) -> None:
-        """
-        Iterates through a response dictionary to check keys' case, and to pass nested values for further test_checks.
-        """
-        if not isinstance(dictionary, dict):
-            raise ValueError(f'Expected dictionary, but received {type(dictionary)}')
-        for key, value in dictionary.items():
-            conditional_check(key, self.case_check, self.ignored_keys)
-            if isinstance(value, dict):
-                self.test_dict(dictionary=value)
-            elif isinstance(value, list):
-                self.test_list(items=value)
-
-    def test_list(self, items: list) -> None:
-        """
-        Iterates through a response list to pass appropriate nested items for further test_checks.
-        Only dictionary keys need case checking, so that's what we're looking for.
+        # Depth-first walk using a stack of (is_dict, iterator) pairs, so keys are checked in the
+        # same order as a recursive traversal, without being limited by the recursion limit
+        stack: Deque[Tuple[bool, Iterator]] = deque()
+        stack.append(
+            (True, iter(response_data.items())) if isinstance(response_data, dict) else (False, iter(response_data))
+        )
+        ignored_keys = self.ignored_keys
+        keys = []
+        skipped_keys = []
+        while stack:
+            is_dict, items = stack[-1]
+            for item in items:
+                if is_dict:
+                    key, item = item
+                    if key not in ignored_keys:
+                        keys.append(key)
+                    else:
+                        skipped_keys.append(key)
+                if isinstance(item, dict):
+                    stack.append((True, iter(item.items())))
+                    break
+                elif isinstance(item, list):
+                    stack.append((False, iter(item)))
+                    break
+            else:
+                stack.pop()
+        if skipped_keys:
+            logger.debug('Skipped case check for ignored keys: %s', skipped_keys)
 
-        :param items: list of unknown items
-        """
-        if not isinstance(items, list):
-            raise ValueError(f'Expected list, but received {type(items)}')
-        for item in items:
-            if isinstance(item, dict):
-                self.test_dict(dictionary=item)
-            elif isinstance(item, list):
-                self.test_list(items=item)
+        _check_keys(keys, self.case_check, correctly_cased_pattern(self.case_check))
 
 
 class SchemaCaseTester(object):
     """
     Iterates through an OpenAPI schema to verify that object keys are cased correctly.
     The case we're checking for depends on the projects SWAGGER_TESTER `CASE` setting.
+
+    Schema items that pass are remembered by identity, and are not checked again. Schemas must therefore not be
+    mutated after they have been validated: keys added to a passing schema item in place are not checked, unless
+    `reset_validated_keys` is called first.
     """
 
     def __init__(self, schema: dict, **kwargs) -> None:
         """
-        Finds the appropriate case check function and calls the appropriate function base on the schema item type.
+        Finds the appropriate case check function, collects the object keys of the schema item, and checks their case.
 
         :param schema: openapi schema item
         """
         self.case_check = case_check(settings.CASE)
         self.ignored_keys = set_ignored_keys(**kwargs)
-        if read_type(schema) == 'object':
-            logger.debug('root -> dict')
-            self.test_dict(schema)
-        elif read_type(schema) == 'array':
-            logger.debug('root -> list')
-            self.test_list(schema)
+        cache_key = (id(schema), settings.CASE, self.ignored_keys)
+        if _schema_validation_cache.get(cache_key) is schema:
+            logger.debug('Schema has already been case checked')
+            return
+        if self.case_check is not skip and read_type(schema) in ('object', 'array'):
+            keys = _collect_schema_keys(schema, self.ignored_keys)
+            _check_keys(keys, self.case_check, correctly_cased_pattern(self.case_check))
         else:
             logger.debug('Skipping case check')
 
-    def test_dict(self, obj: dict) -> None:
-        """
-        Iterates through a schema object to check keys' case, and to pass nested values for further test_checks.
-        """
-        properties = read_properties(obj)
-        for key, value in properties.items():
-            conditional_check(key, self.case_check, self.ignored_keys)
-            if read_type(value) == 'object':
-                logger.debug('dict -> dict')
-                self.test_dict(obj=value)
-            elif read_type(value) == 'array':
-                logger.debug('dict -> list')
-                self.test_list(array=value)
-
-    def test_list(self, array: dict) -> None:
-        """
-        Iterates through a schema array to pass appropriate nested items for further test_checks.
-        Only object keys need case checking, so that's what we're looking for.
-        """
-        item = read_items(array)
-        if read_type(item) == 'object':
-            logger.debug('list -> dict')
-            self.test_dict(obj=item)
-        elif read_type(item) == 'array':
-            logger.debug('list -> list')
-            self.test_list(array=item)
+        if len(_schema_validation_cache) >= _SCHEMA_VALIDATION_CACHE_MAXSIZE:
+            del _schema_validation_cache[next(iter(_schema_validation_cache))]
+        _schema_validation_cache[cache_key] = schema
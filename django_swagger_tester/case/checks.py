@@ -1,6 +1,7 @@
 import logging
 import re
-from typing import Any, Callable, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Pattern, Union
 
 from django_swagger_tester.exceptions import CaseError
 
@@ -17,12 +18,16 @@ def case_error_message(case: str, key: str) -> str:
     )
 
 
-def case_check(case: Union[str, None]) -> Callable[[str, str], None]:
+@lru_cache(maxsize=None)
+def case_check(case: Union[str, None]) -> Callable[[str], None]:
     """
     Returns the appropriate case check based on the `case` input parameter.
 
     Validation for accepted `case` inputs should be done in the package configuration.
 
+    Results are cached by `case`, so resolving the check for the current setting on every
+    tester instantiation is a single lookup, and changing the setting is still picked up.
+
     :param case: str
     :return: callable function
     """
@@ -138,3 +143,23 @@ def skip(*args: Any) -> None:
     :return: None
     """
     logger.debug('Skipping case validation')
+
+
+# Keys matching these patterns are guaranteed to pass the related case check, which lets us accept them in bulk.
+# Keys that don't match are not necessarily incorrectly cased, and still need to be passed to the check itself.
+_correctly_cased_patterns: Dict[Callable, Pattern] = {
+    is_camel_case: re.compile(r'[a-z][a-zA-Z0-9]*'),
+    is_snake_case: re.compile(r'[a-z][a-z0-9_]*'),
+    is_kebab_case: re.compile(r'[a-z][a-z0-9\-]*'),
+    is_pascal_case: re.compile(r'[A-Z][a-zA-Z0-9]*'),
+}
+
+
+def correctly_cased_pattern(function: Callable[[str], None]) -> Optional[Pattern]:
+    """
+    Returns a compiled pattern that fully matches keys which are guaranteed to pass a case check function.
+
+    :param function: case check callable, as returned by `case_check`
+    :return: compiled pattern, or None if the function is not a known case check
+    """
+    return _correctly_cased_patterns.get(function)
@@ -1,20 +1,20 @@
 import logging
-from typing import Callable, List
+from typing import Callable, FrozenSet
 
 logger = logging.getLogger('django_swagger_tester')
 
 
-def set_ignored_keys(**kwargs) -> List[str]:
+def set_ignored_keys(**kwargs) -> FrozenSet[str]:
     """
     Lets users pass a list of string that will not be checked by case-check.
     For example, validate_response(..., ignore_case=["List", "OF", "improperly cased", "kEYS"]).
+
+    The keys are returned as a frozenset, since we look up every checked key in it.
     """
-    if 'ignore_case' in kwargs:
-        return kwargs['ignore_case']
-    return []
+    return frozenset(kwargs.get('ignore_case', ()))
 
 
-def conditional_check(key: str, function: Callable, ignored_keys: list) -> None:
+def conditional_check(key: str, function: Callable, ignored_keys: FrozenSet[str]) -> None:
     """
     Checks a keys case if the key is not ignored.
 
@@ -22,7 +22,7 @@ def conditional_check(key: str, function: Callable, ignored_keys: list) -> None:
 
     :param key: dictionary key
     :param function: case check callable
-    :param ignored_keys: list of ignored values - values that shouldn't be checked
+    :param ignored_keys: set of ignored values - values that shouldn't be checked
     raises: django_swagger_tester.exceptions.CaseError
     """
     if key not in ignored_keys:
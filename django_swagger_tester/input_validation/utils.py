@@ -19,6 +19,7 @@ def get_request_body(schema: dict, method: str, route: str) -> dict:
     :param route: Schema-compatible path
     :return: Request body schema
     """
+    logger.debug('Indexing schema by route `%s` and method `%s`', route, method)
     no_ref_schema = replace_refs(schema)
     paths_schema = index_schema(schema=no_ref_schema, variable='paths')
     route_error = f'\n\nFor debugging purposes: valid routes include {", ".join([key for key in paths_schema.keys()])}'
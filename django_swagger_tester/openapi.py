@@ -8,12 +8,17 @@ in case we're ever dealt with an incorrect schema.
 Instead of raising unhandled errors, it is useful for us to raise appropriate exceptions.
 """
 import logging
-from typing import List
+from typing import Iterator, List, Tuple
 
 from django_swagger_tester.exceptions import OpenAPISchemaError, SwaggerDocumentationError
 
 logger = logging.getLogger('django_swagger_tester')
 
+_TYPE_NAMES = ('string', 'boolean', 'integer', 'number', 'file', 'object', 'array')
+_TYPES = frozenset(_TYPE_NAMES)
+# Sentinel for missing schema attributes, letting us fetch and check for an attribute in a single lookup
+_MISSING = object()
+
 
 def read_items(array: dict) -> dict:
     """
@@ -26,16 +31,17 @@ def read_items(array: dict) -> dict:
     :return: array items
     :raises: django_swagger_tester.exceptions.OpenAPISchemaError
     """
-    if 'items' not in array:
+    items = array.get('items', _MISSING)
+    if items is _MISSING:
         raise OpenAPISchemaError(f'Array is missing an `items` attribute.\n\nArray schema: {array}')
-    return array['items']
+    return items
 
 
 def list_types() -> List[str]:
     """
     Returns supported item types.
     """
-    return ['string', 'boolean', 'integer', 'number', 'file', 'object', 'array']
+    return list(_TYPE_NAMES)
 
 
 def read_type(item: dict) -> str:
@@ -59,7 +65,7 @@ def read_type(item: dict) -> str:
         raise OpenAPISchemaError(
             f'Schema item has an invalid `type` attribute. The type should be a single string.\n\nSchema item: {item}'
         )
-    if not item['type'] in list_types():
+    if item['type'] not in _TYPES:
         raise OpenAPISchemaError(
             f'Schema item has an invalid `type` attribute. '
             f'The type `{item["type"]}` is not supported.\n\nSchema item: {item}'
@@ -75,11 +81,12 @@ def read_additional_properties(schema_object: dict) -> dict:
     :return: schema object additional properties
     :raises: django_swagger_tester.exceptions.OpenAPISchemaError
     """
-    if 'additionalProperties' not in schema_object:
+    additional_properties = schema_object.get('additionalProperties', _MISSING)
+    if additional_properties is _MISSING:
         raise OpenAPISchemaError(
             f'Object is missing a `additionalProperties` attribute.\n\nObject schema: {schema_object}'
         )
-    return schema_object['additionalProperties']
+    return additional_properties
 
 
 def read_properties(schema_object: dict) -> dict:
@@ -90,13 +97,34 @@ def read_properties(schema_object: dict) -> dict:
     :return: schema object properties
     :raises: django_swagger_tester.exceptions.OpenAPISchemaError
     """
-    if 'properties' not in schema_object:
-        if 'additionalProperties' in schema_object:
+    properties = schema_object.get('properties', _MISSING)
+    if properties is _MISSING:
+        additional_properties = schema_object.get('additionalProperties', _MISSING)
+        if additional_properties is not _MISSING:
             # We return this with an empty key, so we can still iterate over the results .items(), as we would with
             # normal properties
-            return {'': read_additional_properties(schema_object)}
+            return {'': additional_properties}
         raise OpenAPISchemaError(f'Object is missing a `properties` attribute.\n\nObject schema: {schema_object}')
-    return schema_object['properties']
+    return properties
+
+
+def iter_properties(schema_object: dict) -> Iterator[Tuple[str, dict]]:
+    """
+    Iterates over the properties of a schema object, like `read_properties(schema_object).items()`.
+
+    Unlike `read_properties`, this doesn't construct a new dict for objects that only have `additionalProperties`.
+
+    :param schema_object: schema object (dict)
+    :return: iterator of (key, schema item) pairs, where `additionalProperties` get an empty key
+    :raises: django_swagger_tester.exceptions.OpenAPISchemaError
+    """
+    properties = schema_object.get('properties', _MISSING)
+    if properties is not _MISSING:
+        return iter(properties.items())
+    additional_properties = schema_object.get('additionalProperties', _MISSING)
+    if additional_properties is not _MISSING:
+        return iter((('', additional_properties),))
+    raise OpenAPISchemaError(f'Object is missing a `properties` attribute.\n\nObject schema: {schema_object}')
 
 
 def is_nullable(schema_item: dict) -> bool:
@@ -115,15 +143,17 @@ def is_nullable(schema_item: dict) -> bool:
     :param schema_item: schema item
     :return: whether or not the item can be None
     """
+    if not isinstance(schema_item, dict):
+        return False
     openapi_schema_3_nullable = 'nullable'
     swagger_2_nullable = 'x-nullable'
-    for nullable_key in [openapi_schema_3_nullable, swagger_2_nullable]:
-        if schema_item and isinstance(schema_item, dict):
-            if nullable_key in schema_item:
-                if isinstance(schema_item[nullable_key], str):
-                    if schema_item[nullable_key] == 'true':
-                        return True
-    return False
+    # YAML and JSON parse `nullable: true` to a bool, but quoted 'true' strings are accepted as well.
+    # Compared explicitly, since a set lookup would also match 1 and 1.0, which hash and compare equal to True
+    nullable = schema_item.get(openapi_schema_3_nullable)
+    if nullable is True or nullable == 'true':
+        return True
+    nullable = schema_item.get(swagger_2_nullable)
+    return nullable is True or nullable == 'true'
 
 
 def index_schema(schema: dict, variable: str, error_addon: str = None) -> dict:
@@ -139,7 +169,6 @@ def index_schema(schema: dict, variable: str, error_addon: str = None) -> dict:
     if error_addon is None:
         error_addon = ''
     try:
-        logger.debug('Indexing schema by `%s`', variable)
         return schema[f'{variable}']
     except KeyError:
         raise SwaggerDocumentationError(
@@ -24,14 +24,15 @@ class ResponseTester:
                 'Received invalid schema. You must replace $ref sections before passing a schema for validation.'
             )
 
-        if read_type(response_schema) == 'object':
+        schema_type = read_type(response_schema)
+        if schema_type == 'object':
             logger.debug('init --> dict')
             self.test_dict(schema=response_schema, data=response_data, reference='init', **kwargs)
-        elif read_type(response_schema) == 'array':
+        elif schema_type == 'array':
             logger.debug('init --> list')
             self.test_list(schema=response_schema, data=response_data, reference='init', **kwargs)
         # this should always be third, as list_types also contains `array` and `object`
-        elif read_type(response_schema) in list_types():
+        elif schema_type in list_types():
             logger.debug('init --> item')
             self.test_item(schema=response_schema, data=response_data, reference='init', **kwargs)
 
@@ -96,17 +97,18 @@ class ResponseTester:
             schema_value = properties[schema_key]
             response_value = data[schema_key]
 
-            if read_type(schema_value) == 'object':
+            schema_value_type = read_type(schema_value)
+            if schema_value_type == 'object':
                 logger.debug('test_dict --> test_dict. Response: %s, Schema: %s', response_value, schema_value)
                 self.test_dict(
                     schema=schema_value, data=response_value, reference=f'{reference}.dict:key:{schema_key}', **kwargs
                 )
-            elif read_type(schema_value) == 'array':
+            elif schema_value_type == 'array':
                 logger.debug('test_dict --> test_list. Response: %s, Schema: %s', response_value, schema_value)
                 self.test_list(
                     schema=schema_value, data=response_value, reference=f'{reference}.dict:key:{schema_key}', **kwargs
                 )
-            elif read_type(schema_value) in list_types():  # This needs to come after array and object test_checks
+            elif schema_value_type in list_types():  # This needs to come after array and object test_checks
                 logger.debug('test_dict --> test_item. Response: %s, Schema: %s', response_value, schema_value)
                 self.test_item(
                     schema=schema_value, data=response_value, reference=f'{reference}.dict:key:{schema_key}', **kwargs
@@ -143,17 +145,20 @@ class ResponseTester:
             )
 
         item = read_items(schema)
+        if not data:
+            return
+        item_type = read_type(item)
         for index in range(len(data)):
 
-            if read_type(item) == 'object':
+            if item_type == 'object':
                 logger.debug('test_list --> test_dict')
                 self.test_dict(schema=item, data=data[index], reference=f'{reference}.list', **kwargs)
 
-            elif read_type(item) == 'array':
+            elif item_type == 'array':
                 logger.debug('test_list --> test_dict')
                 self.test_list(schema=item, data=data[index], reference=f'{reference}.list', **kwargs)
 
-            elif read_type(item) in list_types():
+            elif item_type in list_types():
                 logger.debug('test_list --> test_item')
                 self.test_item(schema=item, data=data[index], reference=f'{reference}.list', **kwargs)
 
@@ -177,15 +182,16 @@ class ResponseTester:
             'number': {'check': not isinstance(data, float) and data is not None, 'type': "<class 'float'>"},
             'file': {'check': not isinstance(data, str) and data is not None, 'type': "<class 'str'>"},
         }
+        schema_type = schema['type']
         if data is None and is_nullable(schema):
             return
-        elif checks[schema['type']]['check']:
+        elif checks[schema_type]['check']:
             raise format_error(
                 error_message=f'Mismatched types.',
                 data=data,
                 schema=schema,
                 reference=reference,
-                hint=f'You need to change the response value type to {checks[schema["type"]]["type"]}, '
+                hint=f'You need to change the response value type to {checks[schema_type]["type"]}, '
                 f'or change your documented type to {type(data)}.',
                 **kwargs,
             )
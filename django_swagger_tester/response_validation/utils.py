@@ -22,6 +22,7 @@ def get_response_schema(schema: dict, route: str, method: str, status_code: Opti
     :param status_code: HTTP response code
     :return Response schema
     """
+    logger.debug('Indexing schema by route `%s`, method `%s`, and status code `%s`', route, method, status_code)
     # Replace all $ref sections in the schema with actual values
     no_ref_schema = replace_refs(schema)
     # Index by paths
@@ -0,0 +1,103 @@
+"""
+Caches parsed schema files, so we only parse a schema again when the file changes.
+
+Static schemas are loaded every time we validate a response, and parsing a large YAML file is
+by far the slowest part of that. Parsed schemas are kept in memory for the current process.
+Callers can also pass a cache directory, to have parsed schemas marshalled to disk so later
+runs can skip parsing as well. Returning the same schema object for an unchanged file also
+lets the schema-identity caches in this package do their job.
+"""
+import hashlib
+import logging
+import marshal
+import os
+import sys
+import tempfile
+from typing import Callable, Dict, Optional, Tuple
+
+from django_swagger_tester import __version__
+
+logger = logging.getLogger('django_swagger_tester')
+
+# Parsed schemas for the current process, keyed by path, as (file signature, schema) pairs
+_loaded_schemas: Dict[str, Tuple[tuple, dict]] = {}
+
+
+def _file_signature(path: str) -> tuple:
+    """
+    Returns a tuple that changes whenever the file, this package, or the Python version changes.
+
+    :raises: OSError
+    """
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size, __version__, sys.version
+
+
+def _cache_file(path: str, cache_dir: str) -> str:
+    """
+    Returns the path of the on-disk cache file for a schema file.
+    """
+    return os.path.join(cache_dir, hashlib.sha256(os.path.abspath(path).encode()).hexdigest() + '.marshal')
+
+
+def _write_cache_file(cache_file: str, content: bytes) -> None:
+    """
+    Writes a cache file atomically, so concurrent readers never see a partially written file.
+
+    :raises: OSError
+    """
+    cache_dir = os.path.dirname(cache_file)
+    os.makedirs(cache_dir, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=cache_dir, suffix='.tmp', delete=False) as f:
+        f.write(content)
+    try:
+        os.replace(f.name, cache_file)
+    except OSError:
+        os.unlink(f.name)
+        raise
+
+
+def load_schema_file(path: str, parse: Callable[[str], dict], cache_dir: Optional[str] = None) -> dict:
+    """
+    Reads and parses a schema file, unless an unchanged version of it has been parsed before.
+
+    The returned schema is shared by every caller loading the same file, and must not be mutated.
+
+    The on-disk cache is best effort: unreadable or outdated cache files are ignored, and schemas
+    that can't be marshalled (e.g., YAML timestamps parsed to datetimes) are only cached in memory.
+    Cache files don't record which parser produced them, so use a separate cache directory per parser.
+
+    :param path: path to the schema file
+    :param parse: callable parsing the file contents
+    :param cache_dir: directory to marshal parsed schemas to; parsed schemas are only kept in memory when None
+    :return: parsed schema
+    :raises: OSError or UnicodeDecodeError if the schema file can't be read
+    """
+    signature = _file_signature(path)
+    cached = _loaded_schemas.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    if cache_dir is None:
+        with open(path, 'r') as f:
+            schema = parse(f.read())
+        _loaded_schemas[path] = (signature, schema)
+        return schema
+
+    cache_file = _cache_file(path, cache_dir)
+    try:
+        with open(cache_file, 'rb') as f:
+            cached_signature, schema = marshal.load(f)
+        if cached_signature != signature:
+            raise ValueError('Outdated cache file')
+        logger.debug('Loaded parsed schema for %s from %s', path, cache_file)
+    except (OSError, EOFError, ValueError, TypeError):
+        with open(path, 'r') as f:
+            schema = parse(f.read())
+        try:
+            _write_cache_file(cache_file, marshal.dumps((signature, schema)))
+        except (OSError, ValueError):
+            logger.debug('Unable to write parsed schema for %s to %s', path, cache_file)
+
+    _loaded_schemas[path] = (signature, schema)
+    return schema
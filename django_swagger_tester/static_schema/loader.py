@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+from functools import partial
 from typing import Optional
 
 import yaml
@@ -9,6 +10,7 @@ from django.core.exceptions import ImproperlyConfigured
 
 from django_swagger_tester.input_validation.utils import get_request_body
 from django_swagger_tester.response_validation.utils import get_response_schema
+from django_swagger_tester.static_schema.cache import load_schema_file
 from django_swagger_tester.utils import resolve_path, validate_inputs
 
 logger = logging.getLogger('django_swagger_tester')
@@ -59,6 +61,7 @@ class LoadStaticSchema:
     def get_schema(self) -> dict:
         """
         Loads a static OpenAPI schema from file, and parses it to a python dict.
+        Parsed schemas are cached until the file changes, so the returned dict is shared and must not be mutated.
 
         :return: Schema contents as a dict
         :raises: ImproperlyConfigured
@@ -68,21 +71,20 @@ class LoadStaticSchema:
             raise ImproperlyConfigured(
                 f'The path `{self.path}` does not point to a valid file. Make sure to point to the specification file.'
             )
+        if '.json' in self.path:
+            parse = json.loads
+        elif '.yaml' in self.path or '.yml' in self.path:
+            parse = partial(yaml.load, Loader=yaml.FullLoader)
+        else:
+            raise ImproperlyConfigured('The specified file path does not seem to point to a JSON or YAML file.')
         try:
             logger.debug('Fetching static schema from %s', self.path)
-            with open(self.path, 'r') as f:
-                content = f.read()
-        except Exception as e:
+            return load_schema_file(self.path, parse)
+        except (OSError, UnicodeDecodeError) as e:
             logger.exception('Exception raised when fetching OpenAPI schema from %s. Error: %s', self.path, e)
             raise ImproperlyConfigured(
                 f'Unable to read the schema file. Please make sure the path setting is correct.\n\nError: {e}'
             )
-        if '.json' in self.path:
-            return json.loads(content)
-        elif '.yaml' in self.path or '.yml' in self.path:
-            return yaml.load(content, Loader=yaml.FullLoader)
-        else:
-            raise ImproperlyConfigured('The specified file path does not seem to point to a JSON or YAML file.')
 
     def get_response_schema(self) -> dict:
         """
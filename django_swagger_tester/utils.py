@@ -1,6 +1,6 @@
 import difflib
 import logging
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 
 from django.core.exceptions import ImproperlyConfigured
 from django.urls import Resolver404, resolve
@@ -9,6 +9,11 @@ from rest_framework.schemas.generators import EndpointEnumerator
 
 logger = logging.getLogger('django_swagger_tester')
 
+# Schemas that have already had their $refs replaced, keyed by id, as (schema, result) pairs.
+# Keeping the schema in the value makes sure its id isn't recycled while the entry exists.
+_replaced_refs: Dict[int, Tuple[dict, dict]] = {}
+_REPLACED_REFS_MAXSIZE = 8
+
 
 def get_paths() -> List[str]:
     """
@@ -95,10 +100,21 @@ def replace_refs(schema: dict) -> dict:
     Finds all $ref sections in a schema and replaces them with the referenced content.
     This way we only have to worry about $refs once.
 
+    Refs are replaced in place, and the result is cached by schema identity, since the schema isn't
+    expected to change during a test run. Passing the same schema again returns the previous result
+    without re-serializing or walking it.
+
     :param schema: OpenAPI schema
     :return Adjusted OpenAPI schema
     """
+    cached = _replaced_refs.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+    if len(_replaced_refs) >= _REPLACED_REFS_MAXSIZE:
+        del _replaced_refs[next(iter(_replaced_refs))]
+
     if '$ref' not in str(schema):
+        _replaced_refs[id(schema)] = (schema, schema)
         return schema
 
     def find_and_replace_refs_recursively(d: dict, schema: dict) -> dict:
@@ -133,7 +149,9 @@ def replace_refs(schema: dict) -> dict:
                 x.append(i)
         return x
 
-    return find_and_replace_refs_recursively(schema, schema)
+    result = find_and_replace_refs_recursively(schema, schema)
+    _replaced_refs[id(schema)] = (schema, result)
+    return result
 
 
 def validate_inputs(route: str, status_code: Optional[int], method: str) -> None:
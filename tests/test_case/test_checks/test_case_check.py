@@ -3,6 +3,7 @@ import pytest
 from django_swagger_tester.case.checks import (
     is_snake_case,
     case_check,
+    correctly_cased_pattern,
     is_camel_case,
     is_kebab_case,
     is_pascal_case,
@@ -26,3 +27,28 @@ def test_case_check_invalid_inputs():
     for item in ['case', '', 1]:
         with pytest.raises(KeyError):
             case_check(item)
+
+
+def test_case_check_is_cached():
+    case_check.cache_clear()
+    case_check('camelCase')
+    case_check('camelCase')
+    case_check('snake_case')
+    assert case_check.cache_info().hits == 1
+    assert case_check.cache_info().misses == 2
+
+
+def test_correctly_cased_patterns():
+    """
+    Keys matched by the patterns must always pass the related case check.
+    """
+    keys = ['a', 'B', 'camelCase', 'PascalCase', 'snake_case', 'kebab-case', 'key1', 'UPPER', '_', '', 'two words']
+    for function in [is_camel_case, is_snake_case, is_kebab_case, is_pascal_case]:
+        pattern = correctly_cased_pattern(function)
+        for key in keys:
+            if pattern.fullmatch(key):
+                function(key)
+    assert correctly_cased_pattern(is_camel_case).fullmatch('camelCase')
+    assert not correctly_cased_pattern(is_camel_case).fullmatch('snake_case')
+    assert correctly_cased_pattern(skip) is None
+    assert correctly_cased_pattern(print) is None
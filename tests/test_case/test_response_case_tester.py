@@ -1,6 +1,7 @@
 import pytest
 
-from django_swagger_tester.case.base import ResponseCaseTester
+from django_swagger_tester.case.base import ResponseCaseTester, _validated_keys, reset_validated_keys
+from django_swagger_tester.case.checks import is_camel_case
 from django_swagger_tester.exceptions import CaseError
 
 valid_cc_response = [
@@ -60,19 +61,38 @@ def test_skipped_case_check(caplog):
     assert 'Skipping case check' in [record.message for record in caplog.records]
 
 
-def test_bad_type_passed_to_test_dict():
+def test_deeply_nested_response():
     """
-    Make sure we're validating the input type.
+    Response depth should not be limited by the recursion limit.
     """
-    r = ResponseCaseTester(response_data=None)
-    with pytest.raises(ValueError, match='Expected dictionary, but received <class \'str\'>'):
-        r.test_dict(dictionary='test')
+    data = {'innerKey': 1}
+    for _ in range(5000):
+        data = {'nestedKey': [data]}
+    ResponseCaseTester(response_data=data)
 
 
-def test_bad_type_passed_to_test_list():
+def test_validated_keys_are_remembered(monkeypatch):
     """
-    Make sure we're validating the input type.
+    Keys that passed the full case check once should be skipped afterwards, until reset.
     """
-    r = ResponseCaseTester(response_data=None)
-    with pytest.raises(ValueError, match='Expected list, but received <class \'str\'>'):
-        r.test_list(items='test')
+
+    class MockSettings:
+        CASE = 'camelCase'
+
+    monkeypatch.setattr('django_swagger_tester.case.base.settings', MockSettings)
+    ResponseCaseTester(response_data={'a_B': 1})
+    assert 'a_B' in _validated_keys[is_camel_case]
+    reset_validated_keys()
+    assert 'a_B' not in _validated_keys[is_camel_case]
+
+
+def test_skip_accepts_any_key(monkeypatch):
+    """
+    With case checks disabled, keys should not be checked at all, so non-string keys are fine as well.
+    """
+
+    class MockSettings:
+        CASE = None
+
+    monkeypatch.setattr('django_swagger_tester.case.base.settings', MockSettings)
+    ResponseCaseTester(response_data={1: 'x', 'Not_Cased': [{None: 'y'}]})
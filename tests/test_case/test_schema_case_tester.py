@@ -2,19 +2,34 @@ import pytest
 import yaml
 from django.conf import settings
 
-from django_swagger_tester.case.base import SchemaCaseTester
+from django_swagger_tester.case.base import (
+    SchemaCaseTester,
+    _collect_schema_keys,
+    reset_validated_keys,
+)
 from django_swagger_tester.exceptions import CaseError
+from django_swagger_tester.static_schema.cache import load_schema_file
 from django_swagger_tester.utils import replace_refs
+from tests.utils import yaml_load
 
 
 def loader(path):
-    with open(settings.BASE_DIR + path, 'r') as f:
-        return replace_refs(yaml.load(f, Loader=yaml.FullLoader))
+    cache_dir = settings.BASE_DIR + '/.pytest_cache/django_swagger_tester'
+    return replace_refs(load_schema_file(settings.BASE_DIR + path, yaml_load, cache_dir))
 
 
 schema = loader('/tests/drf_yasg_reference.yaml')
 
 
+def test_loader_parses_demo_schema():
+    """
+    The demo schema uses syntax libyaml rejects, so the test loader has to fall back to FullLoader.
+    """
+    with open(settings.BASE_DIR + '/demo_project/openapi-schema.yml', 'r') as f:
+        content = f.read()
+    assert yaml_load(content) == yaml.load(content, Loader=yaml.FullLoader)
+
+
 def test_schema_case_tester_on_reference_schema():
     """
     Runs schema test class on reference schema.
@@ -79,3 +94,69 @@ def test_nested_list(caplog):
     """
     SchemaCaseTester(schema={'type': 'array', 'items': {'type': 'array', 'items': {'type': 'integer', 'example': 5}}})
     assert 'list -> list' in [record.message for record in caplog.records]
+
+
+def test_case_check_verdict_is_cached(caplog):
+    item = {'type': 'object', 'properties': {'camelCase': {'type': 'string'}}}
+    SchemaCaseTester(schema=item)
+    assert 'Schema has already been case checked' not in [record.message for record in caplog.records]
+    SchemaCaseTester(schema=item)
+    assert 'Schema has already been case checked' in [record.message for record in caplog.records]
+    caplog.clear()
+    reset_validated_keys()
+    SchemaCaseTester(schema=item)
+    assert 'Schema has already been case checked' not in [record.message for record in caplog.records]
+
+
+def test_mutated_schema_is_checked_after_reset():
+    """
+    Passing schemas are remembered by identity, so in-place changes are only checked again after a reset.
+    """
+    item = {'type': 'object', 'properties': {'goodKey': {'type': 'string'}}}
+    SchemaCaseTester(schema=item)
+    item['properties']['Bad_key'] = {'type': 'string'}
+    reset_validated_keys()
+    with pytest.raises(CaseError, match='The property `Bad_key` is not properly camelCased'):
+        SchemaCaseTester(schema=item)
+
+
+def test_ignored_nested_keys_are_not_checked():
+    """
+    Objects where every key is ignored should contribute no keys to check.
+    """
+    item = {
+        'type': 'object',
+        'properties': {
+            'ignored': {'type': 'object', 'properties': {'alsoIgnored': {'type': 'string'}}},
+            'checked': {'type': 'string'},
+        },
+    }
+    assert _collect_schema_keys(item, frozenset(['ignored', 'alsoIgnored'])) == ('checked',)
+
+
+def test_keys_are_collected_in_traversal_order():
+    """
+    Keys should be checked in the order a recursive traversal would find them, without duplicates.
+    """
+    item = {
+        'type': 'object',
+        'properties': {
+            'a': {'type': 'array', 'items': {'type': 'object', 'properties': {'b': {'type': 'string'}}}},
+            'c': {'type': 'object', 'properties': {'a': {'type': 'string'}, 'd': {'type': 'string'}}},
+        },
+    }
+    assert _collect_schema_keys(item, frozenset()) == ('a', 'b', 'c', 'd')
+
+
+def test_recursive_schemas_terminate():
+    """
+    Recursive $refs resolve to cyclic schemas, which should be walked once, not forever.
+    """
+    node = {'type': 'object', 'properties': {'name': {'type': 'string'}}}
+    node['properties']['children'] = {'type': 'array', 'items': node}
+    node['properties']['parent'] = node
+    looping_array = {'type': 'array'}
+    looping_array['items'] = looping_array
+    node['properties']['looping'] = looping_array
+    assert _collect_schema_keys(node, frozenset()) == ('name', 'children', 'parent', 'looping')
+    SchemaCaseTester(schema=node)
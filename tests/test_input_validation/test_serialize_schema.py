@@ -1,5 +1,4 @@
 import pytest
-import yaml
 from django.core.exceptions import ImproperlyConfigured
 
 from demo_project import settings
@@ -10,11 +9,12 @@ from django_swagger_tester.input_validation.utils import (
     _iterate_schema_list,
 )
 from django_swagger_tester.utils import replace_refs
+from tests.utils import yaml_load
 
 
 def loader(path):
     with open(settings.BASE_DIR + path, 'r') as f:
-        return replace_refs(yaml.load(f, Loader=yaml.FullLoader))
+        return replace_refs(yaml_load(f))
 
 
 schema = loader('/tests/drf_yasg_reference.yaml')
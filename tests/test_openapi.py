@@ -1,13 +1,15 @@
 import pytest
 
-from django_swagger_tester.exceptions import OpenAPISchemaError
+from django_swagger_tester.exceptions import OpenAPISchemaError, SwaggerDocumentationError
 from django_swagger_tester.openapi import (
     read_items,
     list_types,
     read_type,
     read_properties,
+    iter_properties,
     is_nullable,
     read_additional_properties,
+    index_schema,
 )
 
 
@@ -72,6 +74,16 @@ def test_read_read_properties():
         read_properties({})
 
 
+def test_iter_properties():
+    """
+    Should produce the same items as read_properties.
+    """
+    assert list(iter_properties(example)) == list(read_properties(example).items())
+    assert list(iter_properties(additional_example)) == list(read_properties(additional_example).items())
+    with pytest.raises(OpenAPISchemaError, match='Object is missing a `properties` attribute'):
+        iter_properties({})
+
+
 def test_additional_properties_validation():
     with pytest.raises(OpenAPISchemaError):
         read_additional_properties({})
@@ -99,5 +111,15 @@ def test_is_nullable():
     """
     assert is_nullable(nullable_example['properties']['id']) == True
     assert is_nullable(nullable_example['properties']['first_name']) == True
-    for item in [2, '', None, -1, {'nullable': 'false'}]:
+    assert is_nullable({'x-nullable': True}) == True
+    for item in [2, '', None, -1, {'nullable': 'false'}, {'nullable': 1}, {'x-nullable': 1.0}]:
         assert is_nullable(item) == False
+
+
+def test_index_schema():
+    """
+    Ensure these helper functions work as they're designed to.
+    """
+    assert index_schema({'paths': 'test'}, 'paths') == 'test'
+    with pytest.raises(SwaggerDocumentationError, match='Unsuccessfully tried to index the OpenAPI schema by `paths`'):
+        index_schema({}, 'paths')
@@ -0,0 +1,60 @@
+import json
+import os
+
+import pytest
+
+from django_swagger_tester.static_schema import cache
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    return str(tmp_path / 'cache')
+
+
+@pytest.fixture
+def schema_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, '_loaded_schemas', {})
+    path = tmp_path / 'schema.json'
+    path.write_text(json.dumps({'openapi': '3.0.0'}))
+    return str(path)
+
+
+def test_parsed_schema_is_reused(schema_file):
+    """
+    An unchanged file should only be parsed once per process.
+    """
+    calls = []
+
+    def parse(content):
+        calls.append(content)
+        return json.loads(content)
+
+    schema = cache.load_schema_file(schema_file, parse)
+    assert cache.load_schema_file(schema_file, parse) is schema
+    assert len(calls) == 1
+
+
+def test_parsed_schema_is_loaded_from_disk(schema_file, cache_dir, monkeypatch):
+    """
+    A new process should be able to skip parsing, using the on-disk cache.
+    """
+    cache.load_schema_file(schema_file, json.loads, cache_dir)
+    monkeypatch.setattr(cache, '_loaded_schemas', {})
+
+    def parse(content):
+        raise AssertionError('Schema should not be parsed again')
+
+    assert cache.load_schema_file(schema_file, parse, cache_dir) == {'openapi': '3.0.0'}
+    assert [name.endswith('.marshal') for name in os.listdir(cache_dir)] == [True]
+
+
+def test_nothing_is_written_without_cache_dir(schema_file, cache_dir):
+    cache.load_schema_file(schema_file, json.loads)
+    assert not os.path.exists(cache_dir)
+
+
+def test_changed_file_is_parsed_again(schema_file):
+    cache.load_schema_file(schema_file, json.loads)
+    with open(schema_file, 'w') as f:
+        f.write(json.dumps({'openapi': '3.0.1', 'info': {}}))
+    assert cache.load_schema_file(schema_file, json.loads) == {'openapi': '3.0.1', 'info': {}}
@@ -1,6 +1,6 @@
 from django.core.exceptions import ImproperlyConfigured
 
-from django_swagger_tester.utils import get_paths, validate_inputs
+from django_swagger_tester.utils import get_paths, replace_refs, validate_inputs
 
 
 def test_get_paths():
@@ -142,3 +142,13 @@ def test_invalid_inputs():
         validate_inputs(route='str', status_code=200, method='GETs')
     with pytest.raises(ImproperlyConfigured, match='`status_code` should be a valid HTTP response code.'):
         validate_inputs(route='str', status_code=1, method='GET')
+
+
+def test_replace_refs_is_cached():
+    """
+    Make sure repeated calls with the same schema return the first result.
+    """
+    schema = {'definitions': {'item': {'type': 'string'}}, 'item': {'$ref': '#/definitions/item'}}
+    result = replace_refs(schema)
+    assert result['item'] == {'type': 'string'}
+    assert replace_refs(schema) is result
@@ -0,0 +1,16 @@
+import yaml
+
+
+def yaml_load(content):
+    """
+    Parses YAML test schemas with the libyaml-based loader when PyYAML was built with it.
+
+    CFullLoader is many times faster than FullLoader, but libyaml rejects some documents
+    FullLoader accepts (e.g., flow mappings with no space after the colon), so we fall back.
+    """
+    if hasattr(yaml, 'CFullLoader'):
+        try:
+            return yaml.load(content, Loader=yaml.CFullLoader)
+        except yaml.YAMLError:
+            pass
+    return yaml.load(content, Loader=yaml.FullLoader)